@@ -11,6 +11,12 @@ Features:
   4) Vault transfer (deposit into / withdraw from a vault)
   5) Exit
 
+Non-interactive use (skips the menu; add --yes to skip confirmation):
+  python hype_cli.py overview
+  python hype_cli.py unstake --validator 0x... --amount 10
+  python hype_cli.py prepare-env --amount 10.0
+  python hype_cli.py vault-transfer --vault 0x... --amount-usd 1.5 [--deposit]
+
 Requirements:
   - Python 3.10+
   - pip install:
@@ -25,28 +31,42 @@ Config:
       }
 """
 
+from __future__ import annotations
+
 import json
-import os
-from decimal import Decimal
-from typing import Tuple, List, Dict, Any, Optional
-
-from eth_account import Account
-from hyperliquid.exchange import Exchange
-from hyperliquid.info import Info
-from hyperliquid.utils import constants
-from hyperliquid.utils.signing import (
-    get_timestamp_ms,
-    sign_l1_action,
-    float_to_usd_int,
-)
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Tuple, List, Dict, Any, NoReturn, Optional
+
+# The hyperliquid SDK and eth_account are imported lazily by hype_core, so the
+# menu (and "Exit") never pays their import cost.
+if TYPE_CHECKING:
+    from eth_account.signers.local import LocalAccount
+    from hyperliquid.exchange import Exchange
+    from hyperliquid.info import Info
 
 from rich.console import Console
 from rich.table import Table
+from rich.json import JSON
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich.theme import Theme
 from rich import box
 
+from hype_core import (
+    CONFIG_PATH,
+    ENV_PATH,
+    build_clients,
+    hype_to_wei,
+    is_valid_address,
+    load_config,
+    load_wallet,
+    unstake,
+    usd_to_int,
+    vault_transfer,
+    write_withdraw_env,
+)
+
 # ------------------------------
 # Rich console setup
 # ------------------------------
@@ -65,23 +85,43 @@ custom_theme = Theme(
 
 console = Console(theme=custom_theme)
 
-CONFIG_PATH = "config.json"
-ENV_PATH = ".env"
 
-HYPE_DECIMALS = 8
-HYPE_WEI_FACTOR = 10 ** HYPE_DECIMALS
+class StripPrompt(Prompt):
+    """
+    Prompt that strips surrounding whitespace from every answer.
+    """
+
+    def process_response(self, value: str) -> str:
+        return super().process_response(value.strip())
+
+
+ask = StripPrompt.ask
 
 
 # ------------------------------
 # Core helpers
 # ------------------------------
 
-def load_config(path: str = CONFIG_PATH) -> dict:
+def _missing_dependency(exc: ImportError) -> NoReturn:
+    """
+    Report a missing optional dependency at the point it is first needed.
+    """
+    console.print(f"[error]Missing dependency: {exc.name or exc}[/error]")
+    console.print(
+        "[info]Install the requirements with:\n"
+        "  pip install hyperliquid-python-sdk eth-account rich[/info]"
+    )
+    raise SystemExit(1)
+
+
+def load_config_or_exit(path: str = CONFIG_PATH) -> dict:
     """
-    Load local config.json which must contain:
-        { "private_key": "0x..." }
+    Load local config.json, printing a friendly error and exiting if it is
+    missing, not valid JSON or has no 'private_key'.
     """
-    if not os.path.exists(path):
+    try:
+        return load_config(path)
+    except FileNotFoundError:
         console.print(
             f"[error]config.json not found at [highlight]{path}[/highlight].[/error]"
         )
@@ -90,44 +130,24 @@ def load_config(path: str = CONFIG_PATH) -> dict:
             '  { "private_key": "0xYOUR_PRIVATE_KEY_HERE" }[/info]'
         )
         raise SystemExit(1)
-
-    with open(path, "r") as f:
-        cfg = json.load(f)
-
-    if "private_key" not in cfg:
+    except json.JSONDecodeError as e:
+        # Subclass of ValueError, so it must be caught first.
+        console.print(f"[error]config.json is not valid JSON: {e}[/error]")
+        raise SystemExit(1)
+    except ValueError:
         console.print("[error]'private_key' is missing in config.json[/error]")
         raise SystemExit(1)
 
-    return cfg
-
 
-def build_clients(private_key: str) -> Tuple[Account, Info, Exchange]:
+def parse_positive_amount(amount_str: str) -> Optional[float]:
     """
-    Create:
-      - eth_account.Account wallet
-      - Info client (for staking info)
-      - Exchange client (for staking/vault actions)
-    Mainnet only.
+    Parse a positive number, or return None if amount_str is not one.
     """
-    wallet = Account.from_key(private_key)
-    base_url = constants.MAINNET_API_URL
-
-    info = Info(base_url=base_url, skip_ws=True)
-    exchange = Exchange(wallet=wallet, base_url=base_url)
-
-    return wallet, info, exchange
-
-
-def hype_to_wei(amount_hype: str) -> int:
-    """
-    Convert a human-readable HYPE amount ('1.23') into integer wei
-    using 8 decimals (1 HYPE = 100_000_000 wei).
-    """
-    dec = Decimal(amount_hype)
-    wei = int(dec * HYPE_WEI_FACTOR)
-    if wei <= 0:
-        raise ValueError("Amount must be positive.")
-    return wei
+    try:
+        amount = float(amount_str)
+    except ValueError:
+        return None
+    return amount if amount > 0 else None
 
 
 # ------------------------------
@@ -143,26 +163,33 @@ def fetch_staking_data(address: str, info: Info) -> Tuple[Optional[Dict[str, Any
       delegations (user_stakes) anymore, so we only show:
         - overall summary (delegated, undelegated, pending withdrawals)
         - recent rewards (if available)
+
+    Both are independent /info requests, so they are sent concurrently.
     """
-    try:
-        summary = info.user_staking_summary(address)
-    except Exception as e:
-        console.print(f"[error]Error fetching staking summary: {e}[/error]")
-        summary = None
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        summary_future = pool.submit(info.user_staking_summary, address)
+        rewards_future = pool.submit(info.user_staking_rewards, address)
 
-    try:
-        rewards = info.user_staking_rewards(address)
-    except Exception:
-        rewards = []
+        try:
+            summary = summary_future.result()
+        except Exception as e:
+            console.print(f"[error]Error fetching staking summary: {e}[/error]")
+            summary = None
+
+        try:
+            rewards = rewards_future.result()
+        except Exception:
+            rewards = []
 
     return summary, rewards
 
 
-def show_staking_overview(wallet: Account, info: Info) -> None:
+def show_staking_overview(wallet: LocalAccount, info: Info) -> bool:
     """
     Pretty-print staking overview:
-      - Basic summary (raw JSON)
+      - Basic summary (highlighted JSON)
       - Recent rewards (if available)
+    Returns False if the staking summary could not be fetched.
     """
     console.rule("[title]Staking Overview[/title]")
 
@@ -171,10 +198,9 @@ def show_staking_overview(wallet: Account, info: Info) -> None:
     console.print(f"[info]Address:[/info] [highlight]{wallet.address}[/highlight]\n")
 
     if summary is not None:
-        summary_json = json.dumps(summary, indent=2)
         console.print(
             Panel(
-                summary_json,
+                JSON.from_data(summary),
                 title="Staking Summary (raw)",
                 border_style="info",
             )
@@ -192,49 +218,65 @@ def show_staking_overview(wallet: Account, info: Info) -> None:
             header_style="bold magenta",
             box=box.MINIMAL_DOUBLE_HEAD,
         )
-        table.add_column("#", style="muted", justify="right")
-        table.add_column("Reward Entry (truncated)", style="info")
+        table.add_column("#", style="muted", justify="right", no_wrap=True, min_width=1)
+        # Let rich truncate long entries instead of slicing strings ourselves.
+        table.add_column(
+            "Reward Entry (truncated)",
+            style="info",
+            no_wrap=True,
+            overflow="ellipsis",
+            max_width=120,
+        )
 
         for idx, r in enumerate(rewards[:5]):
-            raw = json.dumps(r)
-            raw_short = raw[:120] + "..." if len(raw) > 120 else raw
-            table.add_row(str(idx), raw_short)
+            table.add_row(str(idx), json.dumps(r, separators=(",", ":")))
 
         console.print(table)
 
     console.print()
+    return summary is not None
 
 
 # ------------------------------
 # Actions: Unstake
 # ------------------------------
 
-def action_unstake(wallet: Account, exchange: Exchange) -> None:
+def action_unstake(
+    wallet: LocalAccount,
+    exchange: Exchange,
+    validator: Optional[str] = None,
+    amount_str: Optional[str] = None,
+    assume_yes: bool = False,
+) -> bool:
     """
     Unstake (undelegate) HYPE from a validator.
 
     Because per-validator delegations are not available via the SDK,
     the user must manually enter the validator address.
+    Values passed in (from the command line) are not prompted for.
+    Returns True once the request was sent.
     """
     console.rule("[title]Unstake (Undelegate) HYPE[/title]")
 
     console.print(f"[info]Your address:[/info] [highlight]{wallet.address}[/highlight]\n")
 
-    validator = Prompt.ask("Enter validator address (0x...)").strip()
-    if not (validator.startswith("0x") and len(validator) == 42):
+    if validator is None:
+        validator = ask("Enter validator address (0x...)")
+    if not is_valid_address(validator):
         console.print("[error]Invalid validator address format.[/error]")
-        return
+        return False
 
-    amount_str = Prompt.ask(
-        "Amount of HYPE to unstake (e.g. 10 or 5.5)",
-        default="10"
-    ).strip()
+    if amount_str is None:
+        amount_str = ask(
+            "Amount of HYPE to unstake (e.g. 10 or 5.5)",
+            default="10"
+        )
 
     try:
         wei_amount = hype_to_wei(amount_str)
     except Exception as e:
         console.print(f"[error]Invalid amount: {e}[/error]")
-        return
+        return False
 
     console.print(
         Panel.fit(
@@ -246,84 +288,53 @@ def action_unstake(wallet: Account, exchange: Exchange) -> None:
         )
     )
 
-    if not Confirm.ask("Proceed?", default=False):
+    if not assume_yes and not Confirm.ask("Proceed?", default=False):
         console.print("[warning]Unstake cancelled.[/warning]")
-        return
+        return False
 
     console.print("\n[info]Sending Unstake (token_delegate with is_undelegate=True)...[/info]")
     try:
-        result = exchange.token_delegate(
-            validator=validator,
-            wei=wei_amount,
-            is_undelegate=True,
-        )
+        result = unstake(exchange, validator, wei_amount)
     except Exception as e:
         console.print(f"[error]Error while sending Unstake transaction: {e}[/error]")
-        return
+        return False
 
     console.print("\n[success]Hyperliquid response:[/success]")
     console.print_json(data=result)
     console.print(
         "\n[muted]If status == 'ok', your tokens are now in the lock/unbonding period.[/muted]"
     )
+    return True
 
 
 # ------------------------------
 # Action: Prepare .env for withdraw script
 # ------------------------------
 
-def action_prepare_withdraw_env(wallet: Account) -> None:
+def action_prepare_withdraw_env(wallet: LocalAccount, amount_str: Optional[str] = None) -> bool:
     """
     Prepare or update the .env file used by withdrawFromStaking.ts.
 
     Writes:
       PRIVATE_KEY=<wallet.key>
       AMOUNT_HYPE_TO_WITHDRAW=<amount>
+    Returns True once the file was written.
     """
     console.rule("[title]Prepare .env for Withdraw (staking → spot)[/title]")
 
-    amount_str = Prompt.ask(
-        "Amount of HYPE you plan to withdraw once unlocked (e.g. 10.0)",
-        default="10.0",
-    ).strip()
+    console.print(f"[info]Your address:[/info] [highlight]{wallet.address}[/highlight]\n")
 
-    try:
-        amount_val = float(amount_str)
-        if amount_val <= 0:
-            raise ValueError
-    except Exception:
-        console.print("[error]Amount must be a positive number.[/error]")
-        return
-
-    lines: List[str] = []
-    if os.path.exists(ENV_PATH):
-        with open(ENV_PATH, "r") as f:
-            lines = f.readlines()
-
-    new_lines: List[str] = []
-    seen_pk = False
-    seen_amount = False
-
-    pk_str = f"PRIVATE_KEY={wallet.key.hex()}\n"
-    amt_str = f"AMOUNT_HYPE_TO_WITHDRAW={amount_str}\n"
-
-    for line in lines:
-        if line.startswith("PRIVATE_KEY="):
-            new_lines.append(pk_str)
-            seen_pk = True
-        elif line.startswith("AMOUNT_HYPE_TO_WITHDRAW="):
-            new_lines.append(amt_str)
-            seen_amount = True
-        else:
-            new_lines.append(line)
+    if amount_str is None:
+        amount_str = ask(
+            "Amount of HYPE you plan to withdraw once unlocked (e.g. 10.0)",
+            default="10.0",
+        )
 
-    if not seen_pk:
-        new_lines.append(pk_str)
-    if not seen_amount:
-        new_lines.append(amt_str)
+    if parse_positive_amount(amount_str) is None:
+        console.print("[error]Amount must be a positive number.[/error]")
+        return False
 
-    with open(ENV_PATH, "w") as f:
-        f.writelines(new_lines)
+    write_withdraw_env(wallet.key.hex(), amount_str, ENV_PATH)
 
     console.print(
         Panel.fit(
@@ -339,56 +350,73 @@ def action_prepare_withdraw_env(wallet: Account) -> None:
         "  [highlight]node withdrawFromStaking.js[/highlight]\n"
         "\nMake sure Node.js, TypeScript, and dependencies are installed, and .env is correct."
     )
+    return True
 
 
 # ------------------------------
 # Action: Vault transfer (deposit / withdraw)
 # ------------------------------
 
-def action_vault_transfer(wallet: Account, exchange: Exchange) -> None:
+def action_vault_transfer(
+    wallet: LocalAccount,
+    exchange: Exchange,
+    vault_address: Optional[str] = None,
+    is_deposit: Optional[bool] = None,
+    amount_str: Optional[str] = None,
+    assume_yes: bool = False,
+) -> bool:
     """
     Perform a vaultTransfer:
       - deposit: perp → vault
       - withdraw: vault → perp
+    Values passed in (from the command line) are not prompted for.
+    Returns True once the request was sent.
     """
     console.rule("[title]Vault Transfer (vault ↔ perp account)[/title]")
 
-    vault_address = Prompt.ask(
-        "Vault address (0x...) to transfer to/from",
-    ).strip()
-    if not (vault_address.startswith("0x") and len(vault_address) == 42):
+    if vault_address is None:
+        vault_address = ask(
+            "Vault address (0x...) to transfer to/from",
+        )
+    if not is_valid_address(vault_address):
         console.print("[error]Invalid vault address format.[/error]")
-        return
+        return False
 
-    console.print("\n[highlight]Choose direction:[/highlight]")
-    console.print("  [cyan]1[/cyan]. Deposit into vault (perp → vault)")
-    console.print("  [cyan]2[/cyan]. Withdraw from vault (vault → perp) [default]\n")
+    if is_deposit is None:
+        console.print("\n[highlight]Choose direction:[/highlight]")
+        console.print("  [cyan]1[/cyan]. Deposit into vault (perp → vault)")
+        console.print("  [cyan]2[/cyan]. Withdraw from vault (vault → perp) [default]\n")
 
-    direction_choice = Prompt.ask("Your choice (1/2)", default="2").strip()
-    if direction_choice == "1":
-        is_deposit = True
-    else:
-        is_deposit = False
+        direction_choice = ask("Your choice (1/2)", default="2")
+        if direction_choice == "1":
+            is_deposit = True
+        else:
+            is_deposit = False
 
     direction_label = "DEPOSIT (perp → vault)" if is_deposit else "WITHDRAW (vault → perp)"
 
-    amount_str = Prompt.ask(
-        "Amount in USD (e.g. 1.5)",
-        default="1.0",
-    ).strip()
+    if amount_str is None:
+        amount_str = ask(
+            "Amount in USD (e.g. 1.5)",
+            default="1.0",
+        )
 
+    # Kept as the typed string: usd_to_int scales it in Decimal, never float.
+    amount_usd = amount_str.strip()
     try:
-        amount_usd = float(amount_str)
-        if amount_usd <= 0:
-            raise ValueError
-    except Exception:
+        usd_positive = usd_to_int(amount_usd) > 0
+    except ValueError as e:
+        console.print(f"[error]Invalid amount: {e}[/error]")
+        return False
+    if not usd_positive:
         console.print("[error]Amount must be a positive number.[/error]")
-        return
+        return False
 
     console.print(
         Panel.fit(
             f"You are about to perform:\n"
             f"[highlight]{direction_label}[/highlight]\n\n"
+            f"Wallet: [highlight]{wallet.address}[/highlight]\n"
             f"Vault:  [highlight]{vault_address}[/highlight]\n"
             f"Amount: [highlight]{amount_usd} USD[/highlight]\n\n"
             f"[muted]This uses the 'vaultTransfer' action and moves funds between your perp account and the vault.[/muted]",
@@ -397,38 +425,23 @@ def action_vault_transfer(wallet: Account, exchange: Exchange) -> None:
         )
     )
 
-    if not Confirm.ask("Proceed?", default=False):
+    if not assume_yes and not Confirm.ask("Proceed?", default=False):
         console.print("[warning]Vault transfer cancelled.[/warning]")
-        return
-
-    usd_int = float_to_usd_int(amount_usd)
-    action = {
-        "type": "vaultTransfer",
-        "vaultAddress": vault_address,
-        "isDeposit": is_deposit,
-        "usd": usd_int,
-    }
-
-    timestamp = get_timestamp_ms()
-    signature = sign_l1_action(
-        wallet=wallet,
-        action=action,
-        active_pool=None,
-        nonce=timestamp,
-        expires_after=None,
-        is_mainnet=True,  # mainnet only
-    )
+        return False
 
     console.print("\n[info]Sending vaultTransfer action to Hyperliquid...[/info]")
 
     try:
-        result = exchange._post_action(action, signature, timestamp)
+        result = vault_transfer(wallet, exchange, vault_address, is_deposit, amount_usd)
+    except ImportError:
+        raise
     except Exception as e:
         console.print(f"[error]Error while sending vault transfer: {e}[/error]")
-        return
+        return False
 
     console.print("\n[success]Hyperliquid response:[/success]")
     console.print_json(data=result)
+    return True
 
 
 # ------------------------------
@@ -439,16 +452,16 @@ def main_menu() -> None:
     """
     Main interactive menu loop.
     """
-    cfg = load_config()
+    cfg = load_config_or_exit()
     private_key = cfg["private_key"]
 
-    wallet, info, exchange = build_clients(private_key)
-
+    # No wallet address in the banner: deriving it here would import
+    # eth_account on every launch, even for "Exit". Each action shows the
+    # address once the wallet is built.
     console.print(
         Panel.fit(
-            f"[title]hyperliquid-withdraw-tools[/title]\n\n"
-            f"[info]Connected wallet:[/info] [highlight]{wallet.address}[/highlight]\n"
-            f"[muted]All actions run on Hyperliquid mainnet.[/muted]",
+            "[title]hyperliquid-withdraw-tools[/title]\n\n"
+            "[muted]All actions run on Hyperliquid mainnet.[/muted]",
             border_style="title",
         )
     )
@@ -463,15 +476,20 @@ def main_menu() -> None:
         console.print("  [cyan]4[/cyan]. Vault transfer (deposit / withdraw)")
         console.print("  [cyan]5[/cyan]. Exit\n")
 
-        choice = Prompt.ask("Your choice (1-5)", default="1").strip()
+        choice = ask("Your choice (1-5)", default="1")
 
+        # The wallet and clients are built on first use, so "Exit" never
+        # imports eth_account or the SDK.
         if choice == "1":
+            wallet, info, _ = build_clients(private_key)
             show_staking_overview(wallet, info)
         elif choice == "2":
+            wallet, _, exchange = build_clients(private_key)
             action_unstake(wallet, exchange)
         elif choice == "3":
-            action_prepare_withdraw_env(wallet)
+            action_prepare_withdraw_env(load_wallet(private_key))
         elif choice == "4":
+            wallet, _, exchange = build_clients(private_key)
             action_vault_transfer(wallet, exchange)
         elif choice == "5":
             console.print("\n[success]Goodbye![/success] 👋")
@@ -480,12 +498,104 @@ def main_menu() -> None:
             console.print("[error]Invalid choice. Please select 1, 2, 3, 4, or 5.[/error]")
 
 
+# ------------------------------
+# Direct (non-interactive) commands
+# ------------------------------
+
+def run_command(argv: List[str]) -> None:
+    """
+    Run a single action given on the command line, skipping the menu.
+
+    The parser is only built when arguments are present, and the SDK is
+    only imported once an action that needs it runs, so --help is cheap.
+    Addresses and amounts are checked before any client is built, and the
+    process exits with status 1 if the action fails or is cancelled.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="hype_cli.py",
+        description="HYPE staking and vault tools for Hyperliquid (mainnet). "
+        "Run without arguments for the interactive menu.",
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--config",
+        default=CONFIG_PATH,
+        help=f"Path to config.json (default: {CONFIG_PATH})",
+    )
+    sub = parser.add_subparsers(dest="action", required=True)
+
+    sub.add_parser("overview", parents=[common], help="View staking overview (summary, rewards)")
+
+    p_unstake = sub.add_parser("unstake", parents=[common], help="Unstake (undelegate) HYPE from a validator")
+    p_unstake.add_argument("--validator", required=True, help="Validator address (0x...)")
+    p_unstake.add_argument("--amount", required=True, help="Amount of HYPE to unstake (e.g. 10 or 5.5)")
+    p_unstake.add_argument("-y", "--yes", action="store_true", help="Do not ask for confirmation")
+
+    p_env = sub.add_parser("prepare-env", parents=[common], help="Prepare .env for withdrawFromStaking.ts")
+    p_env.add_argument("--amount", required=True, help="Amount of HYPE to withdraw once unlocked (e.g. 10.0)")
+
+    p_vault = sub.add_parser("vault-transfer", parents=[common], help="Vault transfer (deposit / withdraw)")
+    p_vault.add_argument("--vault", required=True, help="Vault address (0x...)")
+    p_vault.add_argument("--amount-usd", required=True, help="Amount in USD (e.g. 1.5)")
+    direction = p_vault.add_mutually_exclusive_group()
+    direction.add_argument("--deposit", action="store_true", help="Deposit into vault (perp → vault)")
+    direction.add_argument("--withdraw", action="store_true", help="Withdraw from vault (vault → perp) [default]")
+    p_vault.add_argument("-y", "--yes", action="store_true", help="Do not ask for confirmation")
+
+    args = parser.parse_args(argv)
+
+    # Reject bad input before touching the network.
+    if args.action == "unstake":
+        if not is_valid_address(args.validator):
+            parser.error("--validator must be a 0x-prefixed, 40-hex-digit address.")
+        try:
+            hype_to_wei(args.amount)
+        except ValueError as e:
+            parser.error(f"--amount: {e}")
+    elif args.action == "prepare-env":
+        if parse_positive_amount(args.amount) is None:
+            parser.error("--amount must be a positive number.")
+    elif args.action == "vault-transfer":
+        if not is_valid_address(args.vault):
+            parser.error("--vault must be a 0x-prefixed, 40-hex-digit address.")
+        try:
+            usd_positive = usd_to_int(args.amount_usd) > 0
+        except ValueError as e:
+            parser.error(f"--amount-usd: {e}")
+        if not usd_positive:
+            parser.error("--amount-usd must be a positive number.")
+
+    private_key = load_config_or_exit(args.config)["private_key"]
+
+    if args.action == "overview":
+        wallet, info, _ = build_clients(private_key)
+        ok = show_staking_overview(wallet, info)
+    elif args.action == "unstake":
+        wallet, _, exchange = build_clients(private_key)
+        ok = action_unstake(wallet, exchange, args.validator, args.amount, args.yes)
+    elif args.action == "prepare-env":
+        ok = action_prepare_withdraw_env(load_wallet(private_key), args.amount)
+    else:
+        wallet, _, exchange = build_clients(private_key)
+        ok = action_vault_transfer(wallet, exchange, args.vault, args.deposit, args.amount_usd, args.yes)
+
+    if not ok:
+        raise SystemExit(1)
+
+
 # ------------------------------
 # Entry point
 # ------------------------------
 
 if __name__ == "__main__":
     try:
-        main_menu()
+        if len(sys.argv) > 1:
+            run_command(sys.argv[1:])
+        else:
+            main_menu()
     except KeyboardInterrupt:
         console.print("\n[warning]Interrupted by user. Exiting...[/warning]")
+    except ImportError as e:
+        _missing_dependency(e)
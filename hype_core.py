@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+hype_core.py
+
+Shared, UI-agnostic core for the HYPE staking / vault tools on Hyperliquid.
+
+Used by:
+  - hype_cli.py       (rich interactive CLI)
+  - unstake_hype.py   (plain argparse script)
+  - vault_withdraw.py (plain argparse script)
+
+Nothing in this module prints or prompts; errors are raised and the
+calling UI decides how to report them.
+
+The hyperliquid SDK and eth_account are imported lazily inside the functions
+that need them, so importing this module is cheap.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from functools import lru_cache
+from time import time_ns
+from typing import TYPE_CHECKING, Any, Dict, Final, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from decimal import Decimal
+
+    from eth_account.signers.local import LocalAccount
+    from hyperliquid.exchange import Exchange
+    from hyperliquid.info import Info
+
+CONFIG_PATH = "config.json"
+ENV_PATH = ".env"
+
+# HYPE uses 8 decimals for its native "wei"-like unit on Hyperliquid
+# (1 HYPE = 100_000_000 units).
+# Single source of truth for the tools: import these, never redefine them.
+HYPE_DECIMALS: Final[int] = 8
+HYPE_WEI_FACTOR: Final[int] = 100_000_000  # == 10 ** HYPE_DECIMALS
+
+# Perp USD amounts are integers with 6 decimals.
+USD_INT_FACTOR: Final[int] = 1_000_000
+
+# 0x-prefixed 20-byte hex address (validator / vault).
+_ADDR_RE = re.compile(r"0x[0-9a-fA-F]{40}\Z")
+
+
+# ------------------------------
+# Config & conversion helpers
+# ------------------------------
+
+@lru_cache(maxsize=1)
+def load_config(path: str = CONFIG_PATH) -> dict:
+    """
+    Load local config.json which must contain:
+        { "private_key": "0x..." }
+
+    The parsed config is cached per path; treat it as read-only.
+    Raises FileNotFoundError if the file is missing and ValueError if
+    'private_key' is not set.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"config.json not found at {path}")
+
+    with open(path, "r") as f:
+        cfg = json.load(f)
+
+    if "private_key" not in cfg:
+        raise ValueError("config.json must contain 'private_key'.")
+    return cfg
+
+
+def is_valid_address(address: str) -> bool:
+    """
+    Return True if address is a 0x-prefixed, 40-hex-digit address.
+    """
+    return _ADDR_RE.match(address) is not None
+
+
+def hype_to_wei(amount_hype: str) -> int:
+    """
+    Convert a (possibly decimal) HYPE amount string into integer wei units.
+    Example: "1.23" -> 123000000 (for 8 decimals).
+
+    Parsed with plain integer arithmetic: only digits with an optional single
+    '.' are accepted (no sign, exponent or separators), with at most
+    HYPE_DECIMALS fractional digits.
+    """
+    whole, _, frac = amount_hype.strip().partition(".")
+    if not (whole or frac) or not all(
+        part == "" or (part.isascii() and part.isdigit()) for part in (whole, frac)
+    ):
+        raise ValueError(f"Invalid HYPE amount: {amount_hype!r}")
+    if len(frac) > HYPE_DECIMALS:
+        raise ValueError(f"Amount supports at most {HYPE_DECIMALS} decimals.")
+
+    wei = int(whole or "0") * HYPE_WEI_FACTOR + int(frac.ljust(HYPE_DECIMALS, "0"))
+    if wei <= 0:
+        raise ValueError("Amount must be positive.")
+    return wei
+
+
+def usd_to_int(amount_usd: Union[str, Decimal]) -> int:
+    """
+    Convert a USD amount (string as typed, or Decimal) into the perp integer
+    format with 6 decimals, e.g. "1.1" -> 1_100_000.
+
+    Scaled in Decimal, never float, so values like 1.1 do not pick up binary
+    rounding error. Raises ValueError for non-numeric or non-finite amounts;
+    amounts with more than 6 decimals are rejected rather than silently
+    rounded.
+    """
+    # Imported here so the CLIs do not pay for decimal at startup.
+    from decimal import Decimal, InvalidOperation
+
+    try:
+        scaled = Decimal(amount_usd) * USD_INT_FACTOR
+    except (InvalidOperation, TypeError):
+        raise ValueError(f"Invalid USD amount: {amount_usd!r}")
+    if not scaled.is_finite():
+        raise ValueError(f"Invalid USD amount: {amount_usd!r}")
+    if scaled != scaled.to_integral_value():
+        raise ValueError(f"USD amount supports at most 6 decimals: {amount_usd}")
+    return int(scaled)
+
+
+# ------------------------------
+# Clients
+# ------------------------------
+
+@lru_cache(maxsize=8)
+def load_wallet(private_key: str) -> LocalAccount:
+    """
+    Create (once per private key) the eth_account wallet, so repeated
+    actions in one process skip key parsing and derivation.
+    """
+    from eth_account import Account
+
+    return Account.from_key(private_key)
+
+
+@lru_cache(maxsize=4)
+def build_exchange(private_key: str, base_url: Optional[str] = None) -> Exchange:
+    """
+    Create (once per private key and API URL) an Exchange client for
+    staking/vault actions; base_url defaults to mainnet. Reusing it keeps the
+    SDK's HTTP session, and its pooled keep-alive connection to the API,
+    alive across actions.
+    """
+    from hyperliquid.exchange import Exchange
+    from hyperliquid.utils import constants
+
+    return Exchange(
+        wallet=load_wallet(private_key),
+        base_url=base_url or constants.MAINNET_API_URL,
+    )
+
+
+def build_clients(private_key: str) -> Tuple[LocalAccount, Info, Exchange]:
+    """
+    Return (cached per private key):
+      - eth_account.Account wallet
+      - Info client (for staking info)
+      - Exchange client (for staking/vault actions)
+    Mainnet only.
+
+    The Info client is the one the Exchange already owns, so building the
+    clients costs a single set of metadata requests.
+    """
+    exchange = build_exchange(private_key)
+    return exchange.wallet, exchange.info, exchange
+
+
+# ------------------------------
+# Signing
+# ------------------------------
+
+@lru_cache(maxsize=8)
+def _coincurve_key(secret: bytes) -> Any:
+    """
+    coincurve.PrivateKey for secret, built once per key.
+    """
+    from coincurve import PrivateKey
+
+    return PrivateKey(secret)
+
+
+@lru_cache(maxsize=1)
+def _l1_signing_constants() -> Tuple[bytes, bytes]:
+    """
+    (EIP-712 domain separator, Agent struct type hash) for L1 actions.
+
+    The domain (chainId 1337, "Exchange") is the same for every L1 action on
+    both networks, so it is hashed once and reused for every signature.
+    """
+    from eth_account.messages import encode_typed_data
+    from eth_utils import keccak
+    from hyperliquid.utils import signing
+
+    data = signing.l1_payload(signing.construct_phantom_agent(bytes(32), True))
+    domain_separator = encode_typed_data(full_message=data).header
+    return domain_separator, keccak(b"Agent(string source,bytes32 connectionId)")
+
+
+def sign_l1_action(
+    wallet: LocalAccount,
+    action: Dict[str, Any],
+    active_pool: Optional[str],
+    nonce: int,
+    expires_after: Optional[int],
+    is_mainnet: bool,
+) -> Dict[str, Any]:
+    """
+    Drop-in replacement for hyperliquid.utils.signing.sign_l1_action.
+
+    When coincurve (libsecp256k1 bindings) is installed, the EIP-712 digest is
+    signed natively instead of by eth_account's pure-Python ECDSA; otherwise
+    the SDK signer is used. Both are deterministic (RFC 6979, low-s), so the
+    signature is identical either way.
+
+    On the native path the digest is built from the cached domain separator
+    and the phantom-agent struct hash, skipping full EIP-712 encoding.
+    """
+    from hyperliquid.utils import signing
+
+    try:
+        signing_key = _coincurve_key(bytes(wallet.key))
+    except ImportError:
+        return signing.sign_l1_action(wallet, action, active_pool, nonce, expires_after, is_mainnet)
+
+    from eth_utils import keccak
+
+    domain_separator, agent_type_hash = _l1_signing_constants()
+
+    # Phantom agent: {source: "a" (mainnet) / "b" (testnet), connectionId: action hash}
+    connection_id = signing.action_hash(action, active_pool, nonce, expires_after)
+    source = signing.construct_phantom_agent(connection_id, is_mainnet)["source"]
+    struct_hash = keccak(agent_type_hash + keccak(source.encode()) + connection_id)
+    digest = keccak(b"\x19\x01" + domain_separator + struct_hash)
+
+    sig = signing_key.sign_recoverable(digest, hasher=None)
+    return {
+        "r": hex(int.from_bytes(sig[:32], "big")),
+        "s": hex(int.from_bytes(sig[32:64], "big")),
+        "v": 27 + sig[64],
+    }
+
+
+def warm_signer(wallet: LocalAccount) -> None:
+    """
+    Pay the signer's one-time setup (imports, secp256k1 context, cached key)
+    with a throwaway signature, so the real sign runs at steady-state speed.
+
+    Meant to run in a background thread while network I/O is in flight;
+    errors are ignored here and surface on the real sign instead.
+    """
+    try:
+        sign_l1_action(wallet, {"type": "warmup"}, None, 0, None, True)
+    except Exception:
+        pass
+
+
+# ------------------------------
+# Actions
+# ------------------------------
+
+def unstake(exchange: Exchange, validator: str, wei_amount: int) -> Dict[str, Any]:
+    """
+    Unstake (undelegate) wei_amount from validator.
+    token_delegate with is_undelegate=True performs an unstake.
+    """
+    return exchange.token_delegate(
+        validator=validator,
+        wei=wei_amount,
+        is_undelegate=True,
+    )
+
+
+def vault_transfer(
+    wallet: LocalAccount,
+    exchange: Exchange,
+    vault_address: str,
+    is_deposit: bool,
+    amount_usd: Union[str, Decimal],
+) -> Dict[str, Any]:
+    """
+    Sign and send a vaultTransfer (mainnet only):
+      - deposit: perp → vault
+      - withdraw: vault → perp
+    """
+    usd_int = usd_to_int(amount_usd)
+    action = {
+        "type": "vaultTransfer",
+        "vaultAddress": vault_address,
+        "isDeposit": is_deposit,
+        "usd": usd_int,
+    }
+
+    timestamp = time_ns() // 1_000_000  # ms nonce, integer end to end
+    signature = sign_l1_action(
+        wallet=wallet,
+        action=action,
+        active_pool=None,
+        nonce=timestamp,
+        expires_after=None,
+        is_mainnet=True,  # mainnet only
+    )
+
+    return exchange._post_action(action, signature, timestamp)
+
+
+def write_withdraw_env(private_key: str, amount_str: str, path: str = ENV_PATH) -> None:
+    """
+    Create or update the .env file used by withdrawFromStaking.ts.
+
+    Writes:
+      PRIVATE_KEY=<private_key>
+      AMOUNT_HYPE_TO_WITHDRAW=<amount_str>
+    """
+    # Parse existing .env into {key: line}. Comments and blank lines are kept
+    # under their line number so they survive the rewrite in place.
+    env: Dict[Any, str] = {}
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            for idx, line in enumerate(f):
+                line = line.rstrip("\n")
+                key, sep, _ = line.partition("=")
+                if sep and not line.lstrip().startswith("#"):
+                    env[key.strip()] = line
+                else:
+                    env[idx] = line
+
+    env["PRIVATE_KEY"] = f"PRIVATE_KEY={private_key}"
+    env["AMOUNT_HYPE_TO_WITHDRAW"] = f"AMOUNT_HYPE_TO_WITHDRAW={amount_str}"
+
+    # Write to a temp file and swap it in, so an interrupted write can never
+    # leave a truncated .env behind.
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write("".join(f"{line}\n" for line in env.values()))
+    os.replace(tmp_path, path)
@@ -13,37 +13,15 @@ Usage examples:
 
 import json
 import argparse
-from decimal import Decimal
 
-from eth_account import Account
-from hyperliquid.exchange import Exchange
-from hyperliquid.utils import constants
-
-# HYPE uses 8 decimals for its native "wei"-like unit on Hyperliquid
-# (1 HYPE = 100_000_000 units). 
-HYPE_DECIMALS = 8
-HYPE_WEI_FACTOR = 10 ** HYPE_DECIMALS
-
-
-def load_config(path: str = "config.json"):
-    with open(path, "r") as f:
-        cfg = json.load(f)
-
-    if "private_key" not in cfg:
-        raise ValueError("config.json must contain 'private_key'.")
-    return cfg
-
-
-def hype_to_wei(amount_hype: str) -> int:
-    """
-    Convert a (possibly decimal) HYPE amount string into integer wei units.
-    Example: "1.23" -> 123000000 (for 8 decimals).
-    """
-    dec = Decimal(amount_hype)
-    wei = int(dec * HYPE_WEI_FACTOR)
-    if wei <= 0:
-        raise ValueError("Amount must be positive.")
-    return wei
+from hype_core import (
+    build_exchange,
+    hype_to_wei,
+    is_valid_address,
+    load_config,
+    load_wallet,
+    unstake,
+)
 
 
 def main():
@@ -66,10 +44,13 @@ def main():
 
     args = parser.parse_args()
 
+    if not is_valid_address(args.validator):
+        parser.error("--validator must be a 0x-prefixed, 40-hex-digit address.")
+
     cfg = load_config(args.config)
 
     private_key = cfg["private_key"]
-    delegator_wallet = Account.from_key(private_key)
+    delegator_wallet = load_wallet(private_key)
 
     print(f"Using delegator address: {delegator_wallet.address}")
     print(f"Target validator: {args.validator}")
@@ -80,19 +61,12 @@ def main():
     print(f"Unstaking amount in wei units: {wei_amount}")
 
     # Initialize Exchange client on mainnet
-    exchange = Exchange(
-        wallet=delegator_wallet,
-        base_url=constants.MAINNET_API_URL,  # mainnet endpoint 
-    )
+    exchange = build_exchange(private_key)
 
-    # token_delegate with is_undelegate=True performs an unstake. 
+    # token_delegate with is_undelegate=True performs an unstake.
     print("\nSending undelegate (unstake) transaction...")
     try:
-        result = exchange.token_delegate(
-            validator=args.validator,
-            wei=wei_amount,
-            is_undelegate=True,
-        )
+        result = unstake(exchange, args.validator, wei_amount)
     except Exception as e:
         print(f"\n❌ Error while sending unstake transaction: {e}")
         return